@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+from fastapi import Request
+
+from packages.core.audit import AuditStore
+from packages.core.config import CallbackConfig
+from packages.core.n8n import WorkflowIdCache
+
+
+def get_n8n_client(request: Request) -> httpx.AsyncClient:
+    """Return the shared n8n HTTP client created during app startup."""
+
+    return request.app.state.n8n_client
+
+
+def get_n8n_webhook_base(request: Request) -> str:
+    """Return the n8n webhook base URL (no trailing slash) resolved at startup."""
+
+    return request.app.state.n8n_webhook_base
+
+
+def get_dispatch_slots(request: Request) -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent n8n webhook dispatches."""
+
+    return request.app.state.n8n_dispatch_slots
+
+
+def get_workflow_id_cache(request: Request) -> WorkflowIdCache:
+    """Return the shared n8n workflow id cache."""
+
+    return request.app.state.n8n_workflow_ids
+
+
+def get_audit_store(request: Request) -> AuditStore:
+    """Return the audit store opened during app startup."""
+
+    return request.app.state.audit_store
+
+
+def get_callback_config(request: Request) -> CallbackConfig:
+    """Return the callback verification config captured at startup."""
+
+    return request.app.state.callback_config
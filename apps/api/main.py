@@ -1,18 +1,50 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI
 
 from apps.api.routes import health
 from apps.api.routes.v1 import callbacks, jobs, meta
-from packages.core.config import settings
+from packages.core.audit import AuditStore
+from packages.core.config import CallbackConfig, settings
 from packages.core.logging import setup_logging
-from packages.core.registry import get_registry
+from packages.core.n8n import WorkflowIdCache
+from packages.core.registry import get_workflow_keys
 
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Fail fast if registry cannot be loaded and manage shared clients/stores."""
+
+    get_workflow_keys()
+
+    app.state.n8n_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+    app.state.n8n_webhook_base = settings.n8n_webhook_base_url.rstrip("/")
+    app.state.n8n_dispatch_slots = asyncio.Semaphore(settings.n8n_dispatch_concurrency)
+    app.state.n8n_workflow_ids = WorkflowIdCache()
+    app.state.audit_store = AuditStore(settings.audit_db_path)
+    app.state.callback_config = CallbackConfig.from_settings(settings)
+    try:
+        await app.state.audit_store.start()
+        yield
+    finally:
+        await app.state.audit_store.close()
+        await app.state.n8n_client.aclose()
+
+
 app = FastAPI(
     title=settings.flowbiz_service_name,
     version=settings.flowbiz_version,
     docs_url="/docs" if settings.app_env == "dev" else None,
     redoc_url="/redoc" if settings.app_env == "dev" else None,
+    lifespan=lifespan,
 )
 
 app.include_router(health.router)
@@ -21,13 +53,6 @@ app.include_router(jobs.router)
 app.include_router(callbacks.router)
 
 
-@app.on_event("startup")
-async def preload_registry() -> None:
-    """Fail fast if registry cannot be loaded."""
-
-    get_registry()
-
-
 if __name__ == "__main__":
     import uvicorn
 
@@ -36,4 +61,5 @@ if __name__ == "__main__":
         host=settings.app_host,
         port=settings.app_port,
         reload=settings.app_env == "dev",
+        workers=settings.app_workers,
     )
@@ -1,36 +1,48 @@
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import hmac
+import re
+from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import ValidationError
 
-from packages.core.audit import persist_audit
-from packages.core.config import settings
+from apps.api.dependencies import get_audit_store, get_callback_config
+from packages.core.audit import AuditStore
+from packages.core.config import CallbackConfig
 from packages.core.logging import get_logger
-from packages.core.schemas.callback import JobCallback
+from packages.core.schemas.callback import JobCallbackAdapter
 
 router = APIRouter(prefix="/v1")
 logger = get_logger(__name__)
 _SIGNATURE_HEADER = "x-callback-signature"
+_SIGNATURE_RE = re.compile(r"[0-9a-f]{64}")
+_OFFLOAD_THRESHOLD_BYTES = 64 * 1024
 
 
-def _compute_signature(secret: str, body: bytes) -> str:
-    """Return hex-encoded HMAC-SHA256 signature for the given body."""
+@lru_cache(maxsize=4)
+def _signing_key(secret: str) -> bytes:
+    """Encode the signing secret once instead of on every callback."""
 
-    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return secret.encode()
 
 
-def _verify_signature(body: bytes, provided: str | None, job_id: str | None) -> None:
-    """Validate callback signature when secret is configured."""
+def _new_signer(secret: str) -> hmac.HMAC:
+    """Return an OpenSSL-backed HMAC-SHA256 object to be fed the body incrementally."""
 
-    if not settings.callback_signing_secret:
+    return hmac.new(_signing_key(secret), digestmod="sha256")
+
+
+def _require_signature(secret: str | None, provided: str | None, job_id: str | None) -> bool:
+    """Return True if the body must be verified; reject missing signatures up front."""
+
+    if not secret:
         logger.warning(
             "callback signature not validated (secret missing)",
             extra={"job_id": job_id, "status": None, "workflow_key": None, "client_id": None},
         )
-        return
+        return False
 
     if not provided:
         logger.warning(
@@ -42,8 +54,20 @@ def _verify_signature(body: bytes, provided: str | None, job_id: str | None) ->
             detail="Missing callback signature",
         )
 
-    expected = _compute_signature(settings.callback_signing_secret, body)
-    if not hmac.compare_digest(provided, expected):
+    return True
+
+
+def _verify_signature(expected: bytes, provided: str, job_id: str | None) -> None:
+    """Validate the hex callback signature against the raw pre-computed digest."""
+
+    # Only exact lowercase hex is accepted; bytes.fromhex alone would also take
+    # uppercase digits and embedded whitespace.
+    if _SIGNATURE_RE.fullmatch(provided):
+        provided_digest = bytes.fromhex(provided)
+    else:
+        provided_digest = b""
+
+    if not hmac.compare_digest(provided_digest, expected):
         logger.warning(
             "callback signature invalid",
             extra={"job_id": job_id, "status": None, "workflow_key": None, "client_id": None},
@@ -55,15 +79,31 @@ def _verify_signature(body: bytes, provided: str | None, job_id: str | None) ->
 
 
 @router.post("/callbacks/n8n", status_code=status.HTTP_200_OK)
-async def receive_callback(request: Request) -> dict[str, str]:
+async def receive_callback(
+    request: Request,
+    audit_store: AuditStore = Depends(get_audit_store),
+    config: CallbackConfig = Depends(get_callback_config),
+) -> dict[str, str]:
     """Accept callback payloads from n8n and acknowledge receipt."""
 
-    raw_body = await request.body()
+    secret = config.signing_secret
+    provided = request.headers.get(_SIGNATURE_HEADER)
+    signer = _new_signer(secret) if _require_signature(secret, provided, job_id=None) else None
+
+    raw_body = bytearray()
+    async for chunk in request.stream():
+        raw_body.extend(chunk)
+        if signer is not None:
+            signer.update(chunk)
 
-    _verify_signature(raw_body, request.headers.get(_SIGNATURE_HEADER), job_id=None)
+    if signer is not None:
+        _verify_signature(signer.digest(), provided, job_id=None)
 
     try:
-        callback = JobCallback.model_validate_json(raw_body)
+        if len(raw_body) > _OFFLOAD_THRESHOLD_BYTES:
+            callback = await asyncio.to_thread(JobCallbackAdapter.validate_json, raw_body)
+        else:
+            callback = JobCallbackAdapter.validate_json(raw_body)
     except ValidationError as exc:  # pragma: no cover - fastapi will surface detail
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -82,7 +122,7 @@ async def receive_callback(request: Request) -> dict[str, str]:
     )
 
     try:
-        await persist_audit(callback)
+        await audit_store.persist(callback)
     except Exception as exc:  # pragma: no cover - defensive guard
         logger.error(
             "audit persistence failed",
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict
 from datetime import datetime, timezone
 
 import httpx
-from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
 
+from apps.api.dependencies import (
+    get_dispatch_slots,
+    get_n8n_client,
+    get_n8n_webhook_base,
+    get_workflow_id_cache,
+)
 from packages.core.config import settings
 from packages.core.logging import get_logger
+from packages.core.n8n import WorkflowIdCache, build_workflow_index, lookup_workflow_id
 from packages.core.registry import workflow_exists
 from packages.core.schemas.job import (
     JobCancelRequest,
@@ -21,8 +29,11 @@ from packages.core.schemas.job import (
 
 router = APIRouter(prefix="/v1")
 logger = get_logger(__name__)
+_UTC = timezone.utc
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_RATE_LIMIT_MAX_CLIENTS = 10_000
 _rate_limit_lock = threading.Lock()
-_rate_limit_hits: dict[str, deque[float]] = defaultdict(deque)
+_rate_limit_buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
 
 
 def _job_log_extra(request: JobRequest, status: JobStatus) -> dict[str, object]:
@@ -50,8 +61,18 @@ def _cancel_log_extra(
 
 
 @router.post("/jobs", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
-async def create_job(request: JobRequest, background_tasks: BackgroundTasks) -> JobResponse:
-    """Accept a job request, validate workflow, and dispatch asynchronously."""
+async def create_job(
+    request: JobRequest,
+    background_tasks: BackgroundTasks,
+    client: httpx.AsyncClient = Depends(get_n8n_client),
+    dispatch_slots: asyncio.Semaphore = Depends(get_dispatch_slots),
+    webhook_base: str = Depends(get_n8n_webhook_base),
+) -> Response:
+    """Accept a job request, validate workflow, and dispatch asynchronously.
+
+    The acknowledgement is serialized once by Pydantic and returned as a raw
+    response; ``response_model`` is kept for the OpenAPI schema only.
+    """
 
     if request.timeout_seconds > settings.jobs_max_timeout_seconds:
         raise HTTPException(
@@ -71,7 +92,7 @@ async def create_job(request: JobRequest, background_tasks: BackgroundTasks) ->
             detail="Unknown workflow_key",
         )
 
-    accepted_at = datetime.now(timezone.utc)
+    accepted_at = datetime.now(_UTC)
     response = JobResponse(
         job_id=request.job_id,
         status=JobStatus.PENDING,
@@ -79,23 +100,39 @@ async def create_job(request: JobRequest, background_tasks: BackgroundTasks) ->
         accepted_at=accepted_at,
     )
 
-    background_tasks.add_task(dispatch_to_n8n, request)
+    background_tasks.add_task(dispatch_to_n8n, request, client, dispatch_slots, webhook_base)
 
     logger.info("job accepted", extra=_job_log_extra(request, response.status))
 
-    return response
+    return Response(
+        content=response.model_dump_json(),
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/json",
+    )
+
 
+async def dispatch_to_n8n(
+    request: JobRequest,
+    client: httpx.AsyncClient,
+    dispatch_slots: asyncio.Semaphore,
+    webhook_base: str,
+) -> None:
+    """Fire-and-forget call to n8n webhook; failures are logged.
 
-async def dispatch_to_n8n(request: JobRequest) -> None:
-    """Fire-and-forget call to n8n webhook; failures are logged."""
+    ``dispatch_slots`` caps in-flight webhook calls so bursts queue here instead of
+    overrunning the n8n webhook endpoint and the client's connection pool.
+    """
 
-    webhook_url = f"{settings.n8n_webhook_base_url.rstrip('/')}/{request.workflow_key}"
-    payload = request.model_dump(mode="json")
+    webhook_url = f"{webhook_base}/{request.workflow_key}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(webhook_url, json=payload)
-            response.raise_for_status()
+        async with dispatch_slots:
+            response = await client.post(
+                webhook_url,
+                content=request.model_dump_json(),
+                headers=_JSON_HEADERS,
+            )
+        response.raise_for_status()
     except httpx.HTTPError as exc:
         logger.error("n8n dispatch failed", extra=_job_log_extra(request, JobStatus.PENDING))
         logger.debug("dispatch exception", exc_info=exc)
@@ -106,7 +143,12 @@ async def dispatch_to_n8n(request: JobRequest) -> None:
     response_model=JobCancelResponse,
     status_code=status.HTTP_200_OK,
 )
-async def cancel_job(job_id: str, request: JobCancelRequest) -> JobCancelResponse:
+async def cancel_job(
+    job_id: str,
+    request: JobCancelRequest,
+    client: httpx.AsyncClient = Depends(get_n8n_client),
+    workflow_ids: WorkflowIdCache = Depends(get_workflow_id_cache),
+) -> JobCancelResponse:
     """Deactivate the targeted workflow via n8n and mark the job cancelled."""
 
     if not workflow_exists(request.workflow_key):
@@ -121,7 +163,7 @@ async def cancel_job(job_id: str, request: JobCancelRequest) -> JobCancelRespons
             detail="Kill-switch unavailable: N8N_API_KEY not configured",
         )
 
-    deactivated = await deactivate_workflow(request.workflow_key)
+    deactivated = await deactivate_workflow(request.workflow_key, client, workflow_ids)
     if not deactivated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -140,36 +182,35 @@ async def cancel_job(job_id: str, request: JobCancelRequest) -> JobCancelRespons
     return response
 
 
-async def deactivate_workflow(workflow_key: str) -> bool:
+async def deactivate_workflow(
+    workflow_key: str, client: httpx.AsyncClient, workflow_ids: WorkflowIdCache
+) -> bool:
     """Deactivate the matching workflow in n8n; returns True if deactivated."""
 
     base_url = settings.n8n_api_base_url.rstrip("/")
     headers = {"X-N8N-API-KEY": settings.n8n_api_key or ""}
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            list_response = await client.get(f"{base_url}/workflows", headers=headers)
-            list_response.raise_for_status()
-
-            payload = list_response.json()
-            workflows = payload.get("data") if isinstance(payload, dict) else payload
-            if not isinstance(workflows, list):
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY,
-                    detail="Unexpected n8n response shape",
-                )
-
-            workflow_id = _find_workflow_id(workflow_key, workflows)
+        workflow_id, from_cache = await _resolve_workflow_id(
+            workflow_key, client, workflow_ids, base_url, headers
+        )
+        if not workflow_id:
+            return False
+
+        patch_response = await _patch_inactive(client, base_url, workflow_id, headers)
+        if from_cache and patch_response.status_code == status.HTTP_404_NOT_FOUND:
+            # The workflow may have been re-imported under a new id since it was cached.
+            workflow_ids.invalidate(base_url)
+            workflow_id, _ = await _resolve_workflow_id(
+                workflow_key, client, workflow_ids, base_url, headers
+            )
             if not workflow_id:
                 return False
+            patch_response = await _patch_inactive(client, base_url, workflow_id, headers)
 
-            patch_response = await client.patch(
-                f"{base_url}/workflows/{workflow_id}",
-                headers=headers,
-                json={"active": False},
-            )
-            patch_response.raise_for_status()
+        patch_response.raise_for_status()
     except httpx.HTTPError as exc:
+        workflow_ids.invalidate(base_url)
         logger.error(
             "n8n kill-switch call failed",
             extra={
@@ -188,47 +229,80 @@ async def deactivate_workflow(workflow_key: str) -> bool:
     return True
 
 
-def _find_workflow_id(workflow_key: str, workflows: list[dict[str, object]]) -> str | None:
-    """Best-effort lookup to map registry key to n8n workflow id."""
-
-    target = workflow_key.strip().lower()
-
-    for workflow in workflows:
-        if not isinstance(workflow, dict):
-            continue
+async def _patch_inactive(
+    client: httpx.AsyncClient, base_url: str, workflow_id: str, headers: dict[str, str]
+) -> httpx.Response:
+    return await client.patch(
+        f"{base_url}/workflows/{workflow_id}",
+        headers=headers,
+        json={"active": False},
+    )
 
-        name = workflow.get("name") or workflow.get("displayName")
-        identifier = workflow.get("id")
 
-        slug = str(name).strip().lower().replace(" ", "_") if name else None
+async def _resolve_workflow_id(
+    workflow_key: str,
+    client: httpx.AsyncClient,
+    workflow_ids: WorkflowIdCache,
+    base_url: str,
+    headers: dict[str, str],
+) -> tuple[str | None, bool]:
+    """Map registry key to n8n workflow id, re-listing workflows only on miss or expiry.
+
+    The flag is True when the id came from an index cached before this call, so the
+    caller knows a 404 may mean the id is stale rather than the workflow being gone.
+    """
+
+    cached = workflow_ids.get(base_url)
+    if cached is not None and (workflow_id := lookup_workflow_id(cached, workflow_key)):
+        return workflow_id, True
+
+    async with workflow_ids.lock:
+        refreshed = workflow_ids.get(base_url)
+        if refreshed is not None and refreshed is not cached:
+            if workflow_id := lookup_workflow_id(refreshed, workflow_key):
+                return workflow_id, False
+
+        list_response = await client.get(f"{base_url}/workflows", headers=headers)
+        list_response.raise_for_status()
+
+        payload = list_response.json()
+        workflows = payload.get("data") if isinstance(payload, dict) else payload
+        if not isinstance(workflows, list):
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail="Unexpected n8n response shape",
+            )
 
-        if (
-            name == workflow_key
-            or slug == target
-            or str(identifier) == workflow_key
-            or str(identifier).lower() == target
-        ):
-            return str(identifier)
+        index = build_workflow_index(workflows)
+        workflow_ids.set(base_url, index)
 
-    return None
+    return lookup_workflow_id(index, workflow_key), False
 
 
 def _rate_limit_exceeded(client_id: str) -> bool:
-    """Return True if the client exceeds the per-minute limit."""
+    """Return True if the client exceeds the per-minute limit.
+
+    Each client owns a token bucket of ``limit`` tokens refilled continuously over
+    one minute; buckets are kept in LRU order and capped to bound memory.
+    """
 
     limit = settings.jobs_rate_limit_per_minute
     if limit <= 0:
         return False
 
+    capacity = float(limit)
     now = time.monotonic()
-    window_start = now - 60.0
 
     with _rate_limit_lock:
-        hits = _rate_limit_hits[client_id]
-        while hits and hits[0] < window_start:
-            hits.popleft()
-        if len(hits) >= limit:
-            return True
-        hits.append(now)
-
-    return False
+        tokens, refilled_at = _rate_limit_buckets.get(client_id, (capacity, now))
+        tokens = min(capacity, tokens + (now - refilled_at) * capacity / 60.0)
+        exceeded = tokens < 1.0
+        if not exceeded:
+            tokens -= 1.0
+
+        _rate_limit_buckets[client_id] = (tokens, now)
+        _rate_limit_buckets.move_to_end(client_id)
+        if len(_rate_limit_buckets) > _RATE_LIMIT_MAX_CLIENTS:
+            _rate_limit_buckets.popitem(last=False)
+
+    return exceeded
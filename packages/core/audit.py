@@ -3,22 +3,45 @@ from __future__ import annotations
 import asyncio
 import json
 import sqlite3
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TypeVar
+
+import orjson
 
-from packages.core.config import settings
 from packages.core.logging import get_logger
 from packages.core.schemas.callback import JobCallback
 
 logger = get_logger(__name__)
-_write_lock = asyncio.Lock()
+_UTC = timezone.utc
+
+_T = TypeVar("_T")
+_AuditRow = tuple[str, str, str, str]
+_EntryRow = tuple[str, int, str, str, str, str, int]
+_Pending = tuple[_AuditRow, list[_EntryRow], asyncio.Future[None]]
+_INSERT_SQL = "INSERT INTO audit_logs (stored_at, job_id, status, payload_json) VALUES (?, ?, ?, ?)"
+_INSERT_ENTRY_SQL = (
+    "INSERT INTO audit_entries (log_id, job_id, position, timestamp, action, node_name,"
+    " details_json, duration_ms) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _dumps(value: object) -> str:
+    """Serialize to sorted, compact JSON, falling back to json for ints beyond 64 bits."""
+
+    try:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode()
+    except TypeError:
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
 def _ensure_schema(conn: sqlite3.Connection) -> None:
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS audit_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER PRIMARY KEY,
             stored_at TEXT NOT NULL,
             job_id TEXT NOT NULL,
             status TEXT NOT NULL,
@@ -26,49 +49,191 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
         )
         """
     )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_job ON audit_logs(job_id)")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS audit_entries (
+            id INTEGER PRIMARY KEY,
+            log_id INTEGER NOT NULL REFERENCES audit_logs(id),
+            job_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            timestamp TEXT NOT NULL,
+            action TEXT NOT NULL,
+            node_name TEXT NOT NULL,
+            details_json TEXT NOT NULL,
+            duration_ms INTEGER NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_entries_job ON audit_entries(job_id)")
     conn.commit()
 
 
-def _write_row(db_path: Path, record: dict[str, object]) -> None:
-    conn = sqlite3.connect(db_path)
-    try:
-        _ensure_schema(conn)
-        conn.execute(
-            "INSERT INTO audit_logs (stored_at, job_id, status, payload_json) VALUES (?, ?, ?, ?)",
-            (
-                record["stored_at"],
-                record["job_id"],
-                record["status"],
-                json.dumps(record, separators=(",", ":"), sort_keys=True),
-            ),
+def _is_uri(db_path: Path | str) -> bool:
+    return isinstance(db_path, str) and db_path.startswith("file:")
+
+
+def _connect(db_path: Path | str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, uri=True)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA busy_timeout=5000")
+    _ensure_schema(conn)
+    return conn
+
+
+def _write_rows(conn: sqlite3.Connection, records: list[tuple[_AuditRow, list[_EntryRow]]]) -> None:
+    """Insert callback rows and all of their audit entries in one transaction."""
+
+    with conn:
+        entry_rows = []
+        for row, entries in records:
+            log_id = conn.execute(_INSERT_SQL, row).lastrowid
+            entry_rows.extend((log_id, *entry) for entry in entries)
+        if entry_rows:
+            conn.executemany(_INSERT_ENTRY_SQL, entry_rows)
+
+
+def _fail_pending(queue: asyncio.Queue[_Pending | None]) -> None:
+    """Fail callers whose rows were queued behind the stop sentinel."""
+
+    while True:
+        try:
+            item = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        if item is not None and not item[2].done():
+            item[2].set_exception(RuntimeError("AuditStore is closed"))
+
+
+class AuditStore:
+    """SQLite audit log with one long-lived connection and a batching writer task.
+
+    The connection is opened, used and closed on a single dedicated thread.
+    Callbacks arriving while a batch is being committed are queued and written
+    together in the next transaction, along with one ``audit_entries`` row per
+    audit entry; ``persist`` returns once its rows are committed.
+    ``db_path`` may also be a SQLite ``file:`` URI (e.g. a shared in-memory database).
+    """
+
+    def __init__(self, db_path: Path | str, batch_size: int = 100) -> None:
+        self.db_path: Path | str = db_path if _is_uri(db_path) else Path(db_path)
+        self.batch_size = batch_size
+        self._conn: sqlite3.Connection | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._queue: asyncio.Queue[_Pending | None] | None = None
+        self._writer: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Open the connection, apply pragmas/schema once and start the writer."""
+
+        if isinstance(self.db_path, Path):
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-writer")
+        self._conn = await self._run(_connect, self.db_path)
+        self._queue = asyncio.Queue()
+        self._writer = asyncio.create_task(self._drain(self._queue))
+
+    async def close(self) -> None:
+        """Flush pending rows, stop the writer and close the connection."""
+
+        # Detach the queue first so later persist() calls fail fast instead of
+        # enqueueing into a queue nobody drains.
+        queue, self._queue = self._queue, None
+        if queue is not None:
+            if self._writer is not None:
+                await queue.put(None)
+                await self._writer
+                self._writer = None
+            _fail_pending(queue)
+
+        if self._conn is not None:
+            await self._run(self._conn.close)
+            self._conn = None
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def persist(self, callback: JobCallback) -> Path | str:
+        """Persist callback payload to SQLite for centralized audit retention."""
+
+        queue = self._queue
+        if queue is None:
+            raise RuntimeError("AuditStore is not started")
+
+        record = {
+            "stored_at": datetime.now(_UTC).isoformat(),
+            **callback.model_dump(mode="json"),
+        }
+        row = (
+            record["stored_at"],
+            record["job_id"],
+            record["status"],
+            _dumps(record),
         )
-        conn.commit()
-    finally:
-        conn.close()
+        entries = [
+            (
+                callback.job_id,
+                position,
+                entry["timestamp"],
+                entry["action"],
+                entry["node_name"],
+                _dumps(entry["details"]),
+                entry["duration_ms"],
+            )
+            for position, entry in enumerate(record["audit"])
+        ]
+
+        done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        await queue.put((row, entries, done))
+        await done
 
+        logger.info(
+            "audit persisted",
+            extra={
+                "job_id": callback.job_id,
+                "client_id": None,
+                "workflow_key": None,
+                "status": callback.status,
+            },
+        )
 
-async def persist_audit(callback: JobCallback, db_path: Path | None = None) -> Path:
-    """Persist callback payload to SQLite for centralized audit retention."""
+        return self.db_path
 
-    target_path = Path(db_path or settings.audit_db_path)
-    target_path.parent.mkdir(parents=True, exist_ok=True)
+    async def _drain(self, queue: asyncio.Queue[_Pending | None]) -> None:
+        assert self._conn is not None
 
-    record = {
-        "stored_at": datetime.now(timezone.utc).isoformat(),
-        **callback.model_dump(mode="json"),
-    }
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            if item is None:
+                return
 
-    async with _write_lock:
-        await asyncio.to_thread(_write_row, target_path, record)
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
 
-    logger.info(
-        "audit persisted",
-        extra={
-            "job_id": callback.job_id,
-            "client_id": None,
-            "workflow_key": None,
-            "status": callback.status,
-        },
-    )
+            try:
+                await self._run(
+                    _write_rows, self._conn, [(row, entries) for row, entries, _ in batch]
+                )
+            except Exception as exc:
+                for _, _, done in batch:
+                    if not done.done():
+                        done.set_exception(exc)
+            else:
+                for _, _, done in batch:
+                    if not done.done():
+                        done.set_result(None)
 
-    return target_path
+    async def _run(self, func: Callable[..., _T], *args: object) -> _T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
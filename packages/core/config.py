@@ -1,3 +1,4 @@
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +12,7 @@ class Settings(BaseSettings):
     app_host: str = "127.0.0.1"
     app_port: int = 8000
     app_log_level: str = "info"
+    app_workers: int = 1
 
     # Metadata (FLOWBIZ_*)
     flowbiz_service_name: str = "flowbiz-template-service"
@@ -21,6 +23,7 @@ class Settings(BaseSettings):
     n8n_webhook_base_url: str = "http://127.0.0.1:5678/webhook"
     n8n_api_base_url: str = "http://127.0.0.1:5678/api/v1"
     n8n_api_key: str | None = None
+    n8n_dispatch_concurrency: int = 50
 
     # Jobs API limits
     jobs_max_timeout_seconds: int = 300
@@ -33,4 +36,17 @@ class Settings(BaseSettings):
     audit_db_path: str = "data/audit.db"
 
 
+class CallbackConfig(BaseModel):
+    """Immutable callback verification settings injected into the callback route."""
+
+    signing_secret: str | None = None
+
+    model_config = dict(frozen=True)
+
+    @classmethod
+    def from_settings(cls, source: Settings) -> "CallbackConfig":
+        """Snapshot the callback-related fields of the loaded settings."""
+        return cls(signing_secret=source.callback_signing_secret)
+
+
 settings = Settings()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import NamedTuple
+
+
+class WorkflowIdCache:
+    """Short-lived cache of n8n workflow lookup indexes, keyed by API base URL."""
+
+    def __init__(self, ttl_seconds: float = 60.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.lock = asyncio.Lock()
+        self._entries: dict[str, tuple[float, WorkflowIndex]] = {}
+
+    def get(self, base_url: str) -> WorkflowIndex | None:
+        """Return the cached index for base_url, or None if missing or expired."""
+
+        entry = self._entries.get(base_url)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            return None
+        return entry[1]
+
+    def set(self, base_url: str, index: WorkflowIndex) -> None:
+        """Store a freshly built index for base_url."""
+
+        self._entries[base_url] = (time.monotonic(), index)
+
+    def invalidate(self, base_url: str) -> None:
+        """Drop the cached index for base_url."""
+
+        self._entries.pop(base_url, None)
+
+
+class WorkflowIndex(NamedTuple):
+    """Workflow keys mapped to ``(list position, n8n id)`` of the first workflow owning them.
+
+    ``exact`` holds names and ids as returned by n8n; ``normalized`` holds name slugs
+    and lowercased ids, matched against the stripped, lowercased registry key.
+    """
+
+    exact: dict[str, tuple[int, str]]
+    normalized: dict[str, tuple[int, str]]
+
+
+def build_workflow_index(workflows: list[object]) -> WorkflowIndex:
+    """Index each workflow's name, name slug and id, remembering its list position."""
+
+    index = WorkflowIndex(exact={}, normalized={})
+
+    for position, workflow in enumerate(workflows):
+        if not isinstance(workflow, dict) or workflow.get("id") is None:
+            continue
+
+        identifier = str(workflow["id"])
+        entry = (position, identifier)
+        index.exact.setdefault(identifier, entry)
+        index.normalized.setdefault(identifier.lower(), entry)
+
+        name = workflow.get("name") or workflow.get("displayName")
+        if name:
+            index.exact.setdefault(str(name), entry)
+            index.normalized.setdefault(str(name).strip().lower().replace(" ", "_"), entry)
+
+    return index
+
+
+def lookup_workflow_id(index: WorkflowIndex, workflow_key: str) -> str | None:
+    """Resolve a registry key to the first workflow, in list order, matching any rule."""
+
+    matches = [
+        match
+        for match in (
+            index.exact.get(workflow_key),
+            index.normalized.get(workflow_key.strip().lower()),
+        )
+        if match is not None
+    ]
+    return min(matches)[1] if matches else None
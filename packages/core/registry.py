@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import json
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -21,19 +20,25 @@ class WorkflowRegistry(BaseModel):
 
     workflows: list[WorkflowMetadata]
 
+    @cached_property
+    def keys(self) -> frozenset[str]:
+        """Workflow keys, built once per registry for O(1) membership checks."""
+
+        return frozenset(entry.key for entry in self.workflows)
+
 
 REGISTRY_PATH = Path(__file__).resolve().parents[2] / "workflows" / "registry.json"
 
 
 def _load_registry() -> WorkflowRegistry:
-    """Load the workflow registry from disk."""
+    """Load the workflow registry from disk, parsing and validating in one pass."""
 
-    if not REGISTRY_PATH.exists():
-        raise FileNotFoundError(f"Registry file not found at {REGISTRY_PATH}")
+    try:
+        raw = REGISTRY_PATH.read_bytes()
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Registry file not found at {REGISTRY_PATH}") from exc
 
-    raw = REGISTRY_PATH.read_text(encoding="utf-8")
-    data = json.loads(raw)
-    return WorkflowRegistry(**data)
+    return WorkflowRegistry.model_validate_json(raw)
 
 
 @lru_cache
@@ -43,15 +48,13 @@ def get_registry() -> WorkflowRegistry:
     return _load_registry()
 
 
-@lru_cache
-def get_workflow_keys() -> set[str]:
-    """Return cached set of workflow keys for O(1) lookups."""
+def get_workflow_keys() -> frozenset[str]:
+    """Return the cached, immutable set of workflow keys."""
 
-    registry = get_registry()
-    return {entry.key for entry in registry.workflows}
+    return get_registry().keys
 
 
 def workflow_exists(workflow_key: str) -> bool:
     """Return True if workflow_key is present in the registry."""
 
-    return workflow_key in get_workflow_keys()
+    return workflow_key in get_registry().keys
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class CallbackStatus(StrEnum):
@@ -40,3 +40,6 @@ class JobCallback(BaseModel):
     execution_id: str | None = None
 
     model_config = dict(extra="forbid")
+
+
+JobCallbackAdapter = TypeAdapter(JobCallback)
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter
 
 
 class JobStatus(StrEnum):
@@ -32,6 +32,9 @@ class JobRequest(BaseModel):
     model_config = dict(extra="forbid")
 
 
+JobRequestAdapter = TypeAdapter(JobRequest)
+
+
 class JobResponse(BaseModel):
     """Synchronous acknowledgement for a job request."""
 
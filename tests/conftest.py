@@ -1,8 +1,143 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from apps.api.dependencies import get_callback_config, get_n8n_client  # noqa: E402
+from apps.api.main import app as _app  # noqa: E402
+from packages.core.config import CallbackConfig, settings  # noqa: E402
+
+AUDIT_DB_URI = "file:audit_test?mode=memory&cache=shared"
+
+BASE_JOB: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        "job_id": "job-123",
+        "client_id": "client-abc",
+        "workflow_key": "tiktok_live_helper",
+        "inputs": {"foo": "bar"},
+        "callback_url": "https://example.com/callback",
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def base_job() -> MappingProxyType[str, Any]:
+    """Read-only job payload; derive variants with ``{**base_job, ...}``."""
+
+    return BASE_JOB
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """The application under test, imported once for the whole session."""
+
+    return _app
+
+
+@pytest.fixture(scope="session")
+async def client(app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    """Run the app lifespan once per session and call it in-process over ASGI."""
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "audit_db_path", AUDIT_DB_URI)
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as test_client:
+                yield test_client
+
+
+@pytest.fixture
+def override_callback_secret(
+    app: FastAPI,
+) -> Callable[[str | None], AbstractContextManager[None]]:
+    """Return a context manager that swaps the callback signing secret while active."""
+
+    @contextmanager
+    def override(secret: str | None) -> Iterator[None]:
+        config = CallbackConfig(signing_secret=secret)
+        app.dependency_overrides[get_callback_config] = lambda: config
+        try:
+            yield
+        finally:
+            app.dependency_overrides.pop(get_callback_config, None)
+
+    return override
+
+
+# Status-only responses are never inspected beyond raise_for_status(), so
+# every mock can share them; workflow listings carry per-test JSON and are not.
+_N8N_REQUEST = httpx.Request("POST", "http://n8n")
+_RESP_202 = httpx.Response(202, request=_N8N_REQUEST)
+_RESP_200 = httpx.Response(200, request=_N8N_REQUEST)
+
+
+@pytest.fixture(scope="session")
+def n8n_accepted() -> httpx.Response:
+    """The shared status-only 202 response n8n returns for accepted webhook calls."""
+
+    return _RESP_202
+
+
+def _mock_n8n_client(
+    *,
+    post_error: Exception | None = None,
+    workflows: list[dict[str, Any]] | None = None,
+    list_status: int = 200,
+) -> AsyncMock:
+    """Build an AsyncMock standing in for the shared n8n httpx.AsyncClient."""
+
+    fake = AsyncMock(spec=httpx.AsyncClient)
+    if post_error is not None:
+        fake.post.side_effect = post_error
+    else:
+        fake.post.return_value = _RESP_202
+    fake.get.return_value = httpx.Response(
+        list_status, json={"data": workflows or []}, request=_N8N_REQUEST
+    )
+    fake.patch.return_value = _RESP_200
+    return fake
+
+
+@pytest.fixture
+def mock_n8n_success(app: FastAPI, monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Install an n8n client whose webhook calls succeed."""
+
+    fake = _mock_n8n_client()
+    monkeypatch.setitem(app.dependency_overrides, get_n8n_client, lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def mock_n8n_failure(app: FastAPI, monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Install an n8n client whose webhook calls raise a transport error."""
+
+    fake = _mock_n8n_client(post_error=httpx.HTTPError("boom"))
+    monkeypatch.setitem(app.dependency_overrides, get_n8n_client, lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def mock_n8n_deactivate(app: FastAPI, monkeypatch: pytest.MonkeyPatch) -> Callable[..., AsyncMock]:
+    """Return a factory installing an n8n client that lists the given workflows."""
+
+    def install(workflows: list[dict[str, Any]] | None = None, list_status: int = 200) -> AsyncMock:
+        fake = _mock_n8n_client(workflows=workflows, list_status=list_status)
+        monkeypatch.setitem(app.dependency_overrides, get_n8n_client, lambda: fake)
+        return fake
+
+    return install
@@ -0,0 +1,58 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from packages.core.audit import AuditStore
+from packages.core.schemas.callback import CallbackStatus, JobCallback
+
+
+async def test_audit_store_persists_concurrent_callbacks(tmp_path: Path) -> None:
+    store = AuditStore(tmp_path / "audit.db", batch_size=4)
+    await store.start()
+    try:
+        callbacks = [
+            JobCallback(job_id=f"job-{idx}", status=CallbackStatus.SUCCESS) for idx in range(10)
+        ]
+        await asyncio.gather(*(store.persist(callback) for callback in callbacks))
+    finally:
+        await store.close()
+
+    conn = sqlite3.connect(tmp_path / "audit.db")
+    try:
+        job_ids = {row[0] for row in conn.execute("SELECT job_id FROM audit_logs")}
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(audit_logs)")}
+    finally:
+        conn.close()
+
+    assert job_ids == {f"job-{idx}" for idx in range(10)}
+    assert journal_mode == "wal"
+    assert "idx_audit_job" in indexes
+
+
+async def test_audit_store_rejects_persist_after_close(tmp_path: Path) -> None:
+    store = AuditStore(tmp_path / "audit.db")
+    await store.start()
+    await store.close()
+
+    callback = JobCallback(job_id="job-late", status=CallbackStatus.SUCCESS)
+    with pytest.raises(RuntimeError, match="not started"):
+        await asyncio.wait_for(store.persist(callback), timeout=1)
+
+
+async def test_audit_store_fails_rows_queued_behind_stop(tmp_path: Path) -> None:
+    store = AuditStore(tmp_path / "audit.db")
+    await store.start()
+
+    queue = store._queue
+    assert queue is not None
+    await queue.put(None)
+    stranded: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    await queue.put((("now", "job-stranded", "success", "{}"), [], stranded))
+
+    await store.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        await asyncio.wait_for(stranded, timeout=1)
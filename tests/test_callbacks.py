@@ -1,125 +1,171 @@
-import hashlib
 import hmac
 import json
+import sqlite3
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from typing import Any
 
-from fastapi.testclient import TestClient
+import httpx
+import orjson
+import pytest
+from fastapi import FastAPI
 
-from apps.api.main import app
-from packages.core.config import settings
+_SecretOverride = Callable[[str | None], AbstractContextManager[None]]
 
+_SECRET = "topsecret"
 
-def _build_signature(secret: str, body: str) -> str:
-    return hmac.new(secret.encode(), body.encode(), hashlib.sha256).hexdigest()
 
+def _encode(payload: dict[str, Any]) -> bytes:
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
 
-def test_callbacks_accept_without_secret(caplog: Any) -> None:
-    payload = {
-        "job_id": "job-1",
-        "status": "success",
-        "outputs": {"result": True},
-    }
 
-    with caplog.at_level("WARNING"):
-        with TestClient(app) as client:
-            response = client.post("/v1/callbacks/n8n", json=payload)
+def _sign(body: bytes) -> str:
+    return hmac.digest(_SECRET.encode(), body, "sha256").hex()
 
-    assert response.status_code == 200
-    assert any("signature not validated" in record.message for record in caplog.records)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-def test_callbacks_rejects_invalid_signature(monkeypatch: Any) -> None:
-    monkeypatch.setattr(settings, "callback_signing_secret", "topsecret")
+_BODY_UNSIGNED = _encode({"job_id": "job-1", "status": "success", "outputs": {"result": True}})
 
-    payload = {
-        "job_id": "job-2",
-        "status": "failed",
-        "outputs": {},
+_BODY_MISSING_SIG = _encode({"job_id": "job-4", "status": "success", "outputs": {}})
+
+_BODY_INVALID = _encode({"job_id": "job-2", "status": "failed", "outputs": {}})
+
+_BODY_VALID = _encode(
+    {
+        "job_id": "job-3",
+        "status": "success",
+        "outputs": {"value": 42},
+        "execution_id": "exec-123",
     }
-    body = json.dumps(payload, separators=(",", ":"))
+)
+_SIG_VALID = _sign(_BODY_VALID)
+
+_BODY_LARGE = _encode(
+    {"job_id": "job-large", "status": "success", "outputs": {"blob": "x" * (128 * 1024)}}
+)
+_SIG_LARGE = _sign(_BODY_LARGE)
+
+_AUDIT_PAYLOAD = {
+    "job_id": "job-5",
+    "status": "success",
+    "outputs": {"value": 7},
+    "audit": [
+        {
+            "timestamp": "2024-01-01T00:00:00Z",
+            "action": "run",
+            "node_name": f"node-{idx}",
+            # One entry carries an integer beyond orjson's 64-bit range.
+            "details": {"step": idx if idx < 50 else 2**70},
+            "duration_ms": 12,
+        }
+        for idx in range(1, 51)
+    ],
+    "execution_id": "exec-5",
+}
+_BODY_AUDIT = json.dumps(_AUDIT_PAYLOAD, sort_keys=True, separators=(",", ":")).encode()
+
+
+async def test_callbacks_accept_without_secret(
+    client: httpx.AsyncClient,
+    override_callback_secret: _SecretOverride,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with override_callback_secret(None), caplog.at_level("WARNING"):
+        response = await client.post(
+            "/v1/callbacks/n8n", content=_BODY_UNSIGNED, headers=_JSON_HEADERS
+        )
+
+    assert response.status_code == 200
+    assert "signature not validated" in caplog.text
+
 
+async def test_callbacks_rejects_invalid_signature(
+    client: httpx.AsyncClient,
+    override_callback_secret: _SecretOverride,
+) -> None:
     headers = {
-        "Content-Type": "application/json",
+        **_JSON_HEADERS,
         "X-Callback-Signature": "bad-signature",
     }
 
-    with TestClient(app) as client:
-        response = client.post("/v1/callbacks/n8n", data=body, headers=headers)
+    with override_callback_secret(_SECRET):
+        response = await client.post("/v1/callbacks/n8n", content=_BODY_INVALID, headers=headers)
 
     assert response.status_code == 401
     assert response.json()["detail"] == "Invalid callback signature"
 
 
-def test_callbacks_requires_signature_when_secret_set(monkeypatch: Any) -> None:
-    monkeypatch.setattr(settings, "callback_signing_secret", "topsecret")
+@pytest.mark.parametrize(
+    "signature",
+    [
+        _SIG_VALID.upper(),
+        " ".join(_SIG_VALID[i : i + 2] for i in range(0, len(_SIG_VALID), 2)),
+    ],
+    ids=["uppercase", "spaced"],
+)
+async def test_callbacks_rejects_non_canonical_hex_signature(
+    client: httpx.AsyncClient,
+    override_callback_secret: _SecretOverride,
+    signature: str,
+) -> None:
+    headers = {**_JSON_HEADERS, "X-Callback-Signature": signature}
+
+    with override_callback_secret(_SECRET):
+        response = await client.post("/v1/callbacks/n8n", content=_BODY_VALID, headers=headers)
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid callback signature"
 
-    payload = {
-        "job_id": "job-4",
-        "status": "success",
-        "outputs": {},
-    }
 
-    with TestClient(app) as client:
-        response = client.post("/v1/callbacks/n8n", json=payload)
+async def test_callbacks_requires_signature_when_secret_set(
+    client: httpx.AsyncClient,
+    override_callback_secret: _SecretOverride,
+) -> None:
+    with override_callback_secret(_SECRET):
+        response = await client.post(
+            "/v1/callbacks/n8n", content=_BODY_MISSING_SIG, headers=_JSON_HEADERS
+        )
 
     assert response.status_code == 401
     assert response.json()["detail"] == "Missing callback signature"
 
 
-def test_callbacks_accepts_valid_signature(monkeypatch: Any) -> None:
-    monkeypatch.setattr(settings, "callback_signing_secret", "topsecret")
-
-    payload = {
-        "job_id": "job-3",
-        "status": "success",
-        "outputs": {"value": 42},
-        "execution_id": "exec-123",
-    }
-    body = json.dumps(payload, separators=(",", ":"))
-    signature = _build_signature("topsecret", body)
-
+async def test_callbacks_accepts_valid_signature(
+    client: httpx.AsyncClient,
+    override_callback_secret: _SecretOverride,
+) -> None:
     headers = {
-        "Content-Type": "application/json",
-        "X-Callback-Signature": signature,
+        **_JSON_HEADERS,
+        "X-Callback-Signature": _SIG_VALID,
     }
 
-    with TestClient(app) as client:
-        response = client.post("/v1/callbacks/n8n", data=body, headers=headers)
+    with override_callback_secret(_SECRET):
+        response = await client.post("/v1/callbacks/n8n", content=_BODY_VALID, headers=headers)
 
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
 
 
-def test_callbacks_persist_audit_log(monkeypatch: Any, tmp_path: Any) -> None:
-    db_path = tmp_path / "audit.db"
-    monkeypatch.setattr(settings, "audit_db_path", str(db_path))
+async def test_callbacks_persist_audit_log(client: httpx.AsyncClient, app: FastAPI) -> None:
+    payload = _AUDIT_PAYLOAD
 
-    payload = {
-        "job_id": "job-5",
-        "status": "success",
-        "outputs": {"value": 7},
-        "audit": [
-            {
-                "timestamp": "2024-01-01T00:00:00Z",
-                "action": "run",
-                "node_name": "node-1",
-                "details": {"step": 1},
-                "duration_ms": 12,
-            }
-        ],
-        "execution_id": "exec-5",
-    }
-
-    with TestClient(app) as client:
-        response = client.post("/v1/callbacks/n8n", json=payload)
+    response = await client.post("/v1/callbacks/n8n", content=_BODY_AUDIT, headers=_JSON_HEADERS)
 
     assert response.status_code == 200
 
-    import sqlite3
-
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(app.state.audit_store.db_path, uri=True)
     try:
-        rows = conn.execute("SELECT payload_json FROM audit_logs").fetchall()
+        rows = conn.execute(
+            "SELECT payload_json FROM audit_logs WHERE job_id = ?", (payload["job_id"],)
+        ).fetchall()
+        entry_count = conn.execute(
+            "SELECT COUNT(*) FROM audit_entries WHERE job_id = ?", (payload["job_id"],)
+        ).fetchone()[0]
+        last_details = conn.execute(
+            "SELECT details_json FROM audit_entries WHERE job_id = ? AND position = 49",
+            (payload["job_id"],),
+        ).fetchone()[0]
     finally:
         conn.close()
 
@@ -129,3 +175,46 @@ def test_callbacks_persist_audit_log(monkeypatch: Any, tmp_path: Any) -> None:
     assert record["status"] == payload["status"]
     assert record["audit"][0]["node_name"] == "node-1"
     assert "stored_at" in record
+    assert entry_count == 50
+    assert json.loads(last_details) == {"step": 2**70}
+
+
+async def test_callbacks_persist_integer_beyond_64_bits(
+    client: httpx.AsyncClient, app: FastAPI
+) -> None:
+    body = json.dumps(
+        {"job_id": "job-bigint", "status": "success", "outputs": {"n": 2**70, "s": "héllo"}}
+    )
+
+    response = await client.post("/v1/callbacks/n8n", content=body.encode(), headers=_JSON_HEADERS)
+
+    assert response.status_code == 200
+
+    conn = sqlite3.connect(app.state.audit_store.db_path, uri=True)
+    try:
+        rows = conn.execute(
+            "SELECT payload_json FROM audit_logs WHERE job_id = ?", ("job-bigint",)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert len(rows) == 1
+    assert json.loads(rows[0][0])["outputs"] == {"n": 2**70, "s": "héllo"}
+    # Same raw UTF-8 text the orjson path writes, not \uXXXX escapes.
+    assert '"s":"héllo"' in rows[0][0]
+
+
+async def test_callbacks_accepts_large_payload(
+    client: httpx.AsyncClient,
+    override_callback_secret: _SecretOverride,
+) -> None:
+    headers = {
+        **_JSON_HEADERS,
+        "X-Callback-Signature": _SIG_LARGE,
+    }
+
+    with override_callback_secret(_SECRET):
+        response = await client.post("/v1/callbacks/n8n", content=_BODY_LARGE, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
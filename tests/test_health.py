@@ -1,19 +1,15 @@
-from fastapi.testclient import TestClient
+import httpx
 
-from apps.api.main import app
 
-client = TestClient(app)
-
-
-def test_health_check_returns_200():
+async def test_health_check_returns_200(client: httpx.AsyncClient) -> None:
     """Test that health check returns 200 status code."""
-    response = client.get("/healthz")
+    response = await client.get("/healthz")
     assert response.status_code == 200
 
 
-def test_health_check_response_structure():
+async def test_health_check_response_structure(client: httpx.AsyncClient) -> None:
     """Test that health check returns correct JSON structure."""
-    response = client.get("/healthz")
+    response = await client.get("/healthz")
     data = response.json()
 
     assert "status" in data
@@ -21,25 +17,25 @@ def test_health_check_response_structure():
     assert "version" in data
 
 
-def test_health_check_status_ok():
+async def test_health_check_status_ok(client: httpx.AsyncClient) -> None:
     """Test that health check returns ok status."""
-    response = client.get("/healthz")
+    response = await client.get("/healthz")
     data = response.json()
 
     assert data["status"] == "ok"
 
 
-def test_health_check_service_name():
+async def test_health_check_service_name(client: httpx.AsyncClient) -> None:
     """Test that health check returns service name."""
-    response = client.get("/healthz")
+    response = await client.get("/healthz")
     data = response.json()
 
     assert data["service"] == "flowbiz-template-service"
 
 
-def test_health_check_version():
+async def test_health_check_version(client: httpx.AsyncClient) -> None:
     """Test that health check returns version."""
-    response = client.get("/healthz")
+    response = await client.get("/healthz")
     data = response.json()
 
     assert data["version"] == "0.1.0"
@@ -1,44 +1,44 @@
+import asyncio
+import json
+import re
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
 from datetime import datetime
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, NamedTuple
+from unittest.mock import AsyncMock
 
 import httpx
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
 
-from apps.api.main import app
+from apps.api.dependencies import get_n8n_webhook_base
+from apps.api.routes.v1 import jobs as jobs_module
+from apps.api.routes.v1.jobs import dispatch_to_n8n
+from packages.core import n8n as n8n_module
 from packages.core.config import settings
+from packages.core.n8n import WorkflowIdCache
+from packages.core.schemas.job import JobRequestAdapter
 
+_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?$")
 
-def test_jobs_accepts_known_workflow(monkeypatch: pytest.MonkeyPatch) -> None:
-    calls: list[dict[str, Any]] = []
 
-    class _AsyncClientSuccess:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401 - test helper
-            pass
+@pytest.fixture(autouse=True)
+def _fresh_workflow_ids(app: FastAPI, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(app.state, "n8n_workflow_ids", WorkflowIdCache())
 
-        async def __aenter__(self) -> "_AsyncClientSuccess":
-            return self
 
-        async def __aexit__(self, *exc_info: object) -> None:
-            return None
-
-        async def post(self, *_: Any, **kwargs: Any) -> httpx.Response:
-            calls.append({"payload": kwargs.get("json")})
-            request = httpx.Request("POST", "http://test")
-            return httpx.Response(status_code=202, request=request)
-
-    monkeypatch.setattr(httpx, "AsyncClient", _AsyncClientSuccess)
-
-    payload = {
-        "job_id": "job-123",
-        "client_id": "client-abc",
-        "workflow_key": "tiktok_live_helper",
-        "inputs": {"foo": "bar"},
-        "callback_url": "https://example.com/callback",
-    }
+@pytest.mark.parametrize("workflow_key", ["tiktok_live_helper", "content_pipeline"])
+async def test_jobs_accepts_known_workflow(
+    client: httpx.AsyncClient,
+    app: FastAPI,
+    mock_n8n_success: AsyncMock,
+    base_job: Mapping[str, Any],
+    workflow_key: str,
+) -> None:
+    payload = {**base_job, "workflow_key": workflow_key}
 
-    with TestClient(app) as client:
-        response = client.post("/v1/jobs", json=payload)
+    response = await client.post("/v1/jobs", json=payload)
 
     assert response.status_code == 202
 
@@ -46,240 +46,347 @@ def test_jobs_accepts_known_workflow(monkeypatch: pytest.MonkeyPatch) -> None:
     assert data["job_id"] == "job-123"
     assert data["status"] == "pending"
     assert data["message"] == "accepted"
-    assert datetime.fromisoformat(data["accepted_at"])
-    assert len(calls) == 1
+    assert _ISO_RE.match(data["accepted_at"])
+
+    mock_n8n_success.post.assert_awaited_once()
+    call = mock_n8n_success.post.await_args
+    assert call.args[0] == f"{app.state.n8n_webhook_base}/{workflow_key}"
+    assert json.loads(call.kwargs["content"])["inputs"] == {"foo": "bar"}
 
 
-def test_jobs_dispatch_failure_logs(
-    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+async def test_jobs_accepted_at_parses_as_aware_datetime(
+    client: httpx.AsyncClient, mock_n8n_success: AsyncMock, base_job: Mapping[str, Any]
 ) -> None:
-    class _AsyncClientFailure:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401 - test helper
-            pass
+    response = await client.post("/v1/jobs", json=dict(base_job))
 
-        async def __aenter__(self) -> "_AsyncClientFailure":
-            return self
+    assert response.status_code == 202
+    assert datetime.fromisoformat(response.json()["accepted_at"]).tzinfo is not None
 
-        async def __aexit__(self, *exc_info: object) -> None:
-            return None
 
-        async def post(self, *_: Any, **__: Any) -> httpx.Response:
-            raise httpx.HTTPError("boom")
+async def test_jobs_dispatch_uses_injected_webhook_base(
+    client: httpx.AsyncClient,
+    app: FastAPI,
+    mock_n8n_success: AsyncMock,
+    base_job: Mapping[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(
+        app.dependency_overrides, get_n8n_webhook_base, lambda: "http://n8n-alt:5678/webhook"
+    )
 
-    monkeypatch.setattr(httpx, "AsyncClient", _AsyncClientFailure)
+    response = await client.post("/v1/jobs", json=dict(base_job))
+
+    assert response.status_code == 202
+    url = mock_n8n_success.post.await_args.args[0]
+    assert url == "http://n8n-alt:5678/webhook/tiktok_live_helper"
 
-    payload = {
-        "job_id": "job-456",
-        "client_id": "client-xyz",
-        "workflow_key": "tiktok_live_helper",
-        "inputs": {"foo": "bar"},
-        "callback_url": "https://example.com/callback",
-    }
+
+async def test_jobs_dispatch_failure_logs(
+    client: httpx.AsyncClient,
+    mock_n8n_failure: AsyncMock,
+    base_job: Mapping[str, Any],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    payload = {**base_job, "job_id": "job-456", "client_id": "client-xyz"}
 
     with caplog.at_level("ERROR"):
-        with TestClient(app) as client:
-            response = client.post("/v1/jobs", json=payload)
+        response = await client.post("/v1/jobs", json=payload)
 
     assert response.status_code == 202
-    assert any("n8n dispatch failed" in record.message for record in caplog.records)
+    assert "n8n dispatch failed" in caplog.text
 
 
-def test_jobs_rejects_unknown_workflow(monkeypatch: pytest.MonkeyPatch) -> None:
-    class _AsyncClientSuccess:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401 - test helper
-            pass
+async def test_dispatch_respects_concurrency_limit(
+    base_job: Mapping[str, Any], n8n_accepted: httpx.Response
+) -> None:
+    in_flight = 0
+    peak = 0
 
-        async def __aenter__(self) -> "_AsyncClientSuccess":
-            return self
+    async def slow_post(*_: Any, **__: Any) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return n8n_accepted
 
-        async def __aexit__(self, *exc_info: object) -> None:
-            return None
+    slow_client = AsyncMock(spec=httpx.AsyncClient)
+    slow_client.post.side_effect = slow_post
 
-        async def post(self, *_: Any, **__: Any) -> httpx.Response:
-            return httpx.Response(status_code=202)
+    request = JobRequestAdapter.validate_python(base_job)
+    slots = asyncio.Semaphore(2)
 
-    monkeypatch.setattr(httpx, "AsyncClient", _AsyncClientSuccess)
+    await asyncio.gather(
+        *(dispatch_to_n8n(request, slow_client, slots, "http://n8n/webhook") for _ in range(6))
+    )
+
+    assert peak == 2
 
-    payload = {
-        "job_id": "job-123",
-        "client_id": "client-abc",
-        "workflow_key": "missing_workflow",
-        "inputs": {"foo": "bar"},
-        "callback_url": "https://example.com/callback",
-    }
 
-    with TestClient(app) as client:
-        response = client.post("/v1/jobs", json=payload)
+async def test_jobs_rejects_unknown_workflow(
+    client: httpx.AsyncClient, mock_n8n_success: AsyncMock, base_job: Mapping[str, Any]
+) -> None:
+    payload = {**base_job, "workflow_key": "missing_workflow"}
+
+    response = await client.post("/v1/jobs", json=payload)
 
     assert response.status_code == 400
     assert response.json()["detail"] == "Unknown workflow_key"
+    mock_n8n_success.post.assert_not_awaited()
 
 
-def test_cancel_deactivates_workflow(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(settings, "n8n_api_key", "dummy-key")
-    monkeypatch.setattr(settings, "n8n_api_base_url", "http://n8n:5678/api/v1")
+async def test_jobs_rate_limit_per_client(
+    client: httpx.AsyncClient,
+    mock_n8n_success: AsyncMock,
+    base_job: Mapping[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "jobs_rate_limit_per_minute", 2)
 
-    calls: list[dict[str, object]] = []
+    payload = {**base_job, "job_id": "job-rl", "client_id": "client-rate-limited"}
 
-    class _AsyncClientDeactivate:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401 - test helper
-            pass
+    statuses = [(await client.post("/v1/jobs", json=payload)).status_code for _ in range(3)]
+    other = await client.post("/v1/jobs", json={**payload, "client_id": "client-other"})
 
-        async def __aenter__(self) -> "_AsyncClientDeactivate":
-            return self
+    assert statuses == [202, 202, 429]
+    assert other.status_code == 202
 
-        async def __aexit__(self, *exc_info: object) -> None:
-            return None
 
-        async def get(self, url: str, **__: Any) -> httpx.Response:
-            request = httpx.Request("GET", url)
-            return httpx.Response(
-                status_code=200,
-                request=request,
-                json={"data": [{"id": 7, "name": "tiktok_live_helper", "active": True}]},
-            )
+@pytest.fixture
+def rate_limit_clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Give the rate limiter fresh buckets and a clock the test advances by hand."""
 
-        async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
-            calls.append({"url": url, "payload": kwargs.get("json")})
-            request = httpx.Request("PATCH", url)
-            return httpx.Response(status_code=200, request=request, json={"id": 7, "active": False})
+    now = [1_000.0]
+    monkeypatch.setattr(jobs_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(jobs_module, "_rate_limit_buckets", OrderedDict())
+    return now
 
-    monkeypatch.setattr(httpx, "AsyncClient", _AsyncClientDeactivate)
 
-    payload = {
-        "client_id": "client-123",
-        "workflow_key": "tiktok_live_helper",
-        "reason": "ops kill-switch",
-    }
+def test_rate_limit_refills_continuously(
+    rate_limit_clock: list[float], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "jobs_rate_limit_per_minute", 60)
 
-    with TestClient(app) as client:
-        response = client.post("/v1/jobs/job-999/cancel", json=payload)
+    assert not any(jobs_module._rate_limit_exceeded("client-a") for _ in range(60))
+    assert jobs_module._rate_limit_exceeded("client-a")
 
-    assert response.status_code == 200
-    data = response.json()
-    assert data["job_id"] == "job-999"
-    assert data["status"] == "cancelled"
-    assert data["workflow_deactivated"] is True
-    assert calls and calls[0]["payload"] == {"active": False}
+    rate_limit_clock[0] += 0.5
+    assert jobs_module._rate_limit_exceeded("client-a")
+
+    rate_limit_clock[0] += 0.5
+    assert not jobs_module._rate_limit_exceeded("client-a")
+    assert jobs_module._rate_limit_exceeded("client-a")
 
+    rate_limit_clock[0] += 60.0
+    assert not any(jobs_module._rate_limit_exceeded("client-a") for _ in range(60))
+    assert jobs_module._rate_limit_exceeded("client-a")
 
-def test_cancel_matches_display_name_slug(monkeypatch: pytest.MonkeyPatch) -> None:
+
+def test_rate_limit_evicts_least_recently_used_client(
+    rate_limit_clock: list[float], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "jobs_rate_limit_per_minute", 1)
+    monkeypatch.setattr(jobs_module, "_RATE_LIMIT_MAX_CLIENTS", 2)
+
+    assert not jobs_module._rate_limit_exceeded("client-a")
+    assert not jobs_module._rate_limit_exceeded("client-b")
+    assert jobs_module._rate_limit_exceeded("client-a")
+
+    assert not jobs_module._rate_limit_exceeded("client-c")
+
+    assert list(jobs_module._rate_limit_buckets) == ["client-a", "client-c"]
+    assert jobs_module._rate_limit_exceeded("client-a")
+    assert jobs_module._rate_limit_exceeded("client-c")
+
+
+class _CancelScenario(NamedTuple):
+    workflows: list[dict[str, Any]] | None
+    list_status: int
+    expected_status: int
+    expected_json: dict[str, Any]
+    deactivated_id: int | None = None
+
+
+_CANCEL_SCENARIOS = {
+    "ok": _CancelScenario(
+        workflows=[{"id": 7, "name": "tiktok_live_helper", "active": True}],
+        list_status=200,
+        expected_status=200,
+        expected_json={"job_id": "job-999", "status": "cancelled", "workflow_deactivated": True},
+        deactivated_id=7,
+    ),
+    "displayname": _CancelScenario(
+        workflows=[{"id": 9, "displayName": "TikTok Live Helper", "active": True}],
+        list_status=200,
+        expected_status=200,
+        expected_json={"workflow_deactivated": True},
+        deactivated_id=9,
+    ),
+    "missing": _CancelScenario(
+        workflows=[],
+        list_status=200,
+        expected_status=404,
+        expected_json={"detail": "Workflow not found in n8n"},
+    ),
+    "failure": _CancelScenario(
+        workflows=None,
+        list_status=500,
+        expected_status=502,
+        expected_json={"detail": "Failed to deactivate workflow via n8n"},
+    ),
+}
+
+
+@pytest.mark.parametrize("scenario", list(_CANCEL_SCENARIOS))
+async def test_cancel_scenarios(
+    client: httpx.AsyncClient,
+    mock_n8n_deactivate: Callable[..., AsyncMock],
+    monkeypatch: pytest.MonkeyPatch,
+    scenario: str,
+) -> None:
+    case = _CANCEL_SCENARIOS[scenario]
     monkeypatch.setattr(settings, "n8n_api_key", "dummy-key")
+    monkeypatch.setattr(settings, "n8n_api_base_url", "http://n8n:5678/api/v1")
+
+    fake = mock_n8n_deactivate(case.workflows, list_status=case.list_status)
+
+    payload = {
+        "client_id": "client-123",
+        "workflow_key": "tiktok_live_helper",
+        "reason": "ops kill-switch",
+    }
 
-    class _AsyncClientDeactivate:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401 - test helper
-            pass
+    response = await client.post("/v1/jobs/job-999/cancel", json=payload)
 
-        async def __aenter__(self) -> "_AsyncClientDeactivate":
-            return self
+    assert response.status_code == case.expected_status
+    assert response.json().items() >= case.expected_json.items()
 
-        async def __aexit__(self, *exc_info: object) -> None:
-            return None
+    if case.deactivated_id is None:
+        fake.patch.assert_not_awaited()
+    else:
+        fake.patch.assert_awaited_once()
+        url = f"http://n8n:5678/api/v1/workflows/{case.deactivated_id}"
+        assert fake.patch.await_args.args[0] == url
+        assert fake.patch.await_args.kwargs["json"] == {"active": False}
 
-        async def get(self, url: str, **__: Any) -> httpx.Response:
-            request = httpx.Request("GET", url)
-            return httpx.Response(
-                status_code=200,
-                request=request,
-                json={"data": [{"id": 9, "displayName": "TikTok Live Helper", "active": True}]},
-            )
 
-        async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
-            request = httpx.Request("PATCH", url)
-            return httpx.Response(status_code=200, request=request, json={"id": 9, "active": False})
+async def test_cancel_reuses_cached_workflow_listing(
+    client: httpx.AsyncClient,
+    mock_n8n_deactivate: Callable[..., AsyncMock],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "n8n_api_key", "dummy-key")
 
-    monkeypatch.setattr(httpx, "AsyncClient", _AsyncClientDeactivate)
+    fake = mock_n8n_deactivate([{"id": 7, "name": "tiktok_live_helper", "active": True}])
 
     payload = {
-        "client_id": "client-321",
+        "client_id": "client-123",
         "workflow_key": "tiktok_live_helper",
     }
 
-    with TestClient(app) as client:
-        response = client.post("/v1/jobs/job-111/cancel", json=payload)
+    first = await client.post("/v1/jobs/job-1/cancel", json=payload)
+    second = await client.post("/v1/jobs/job-2/cancel", json=payload)
 
-    assert response.status_code == 200
-    assert response.json()["workflow_deactivated"] is True
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert fake.get.await_count == 1
 
 
-def test_cancel_requires_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(settings, "n8n_api_key", None)
+def _listing(workflow_id: int) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"data": [{"id": workflow_id, "name": "tiktok_live_helper", "active": True}]},
+        request=httpx.Request("GET", "http://n8n"),
+    )
 
-    payload = {
-        "client_id": "client-789",
-        "workflow_key": "tiktok_live_helper",
-    }
 
-    with TestClient(app) as client:
-        response = client.post("/v1/jobs/job-1/cancel", json=payload)
+def _status_only(status_code: int) -> httpx.Response:
+    return httpx.Response(status_code, request=httpx.Request("PATCH", "http://n8n"))
 
-    assert response.status_code == 503
-    assert "N8N_API_KEY" in response.json()["detail"]
+
+_CANCEL_PAYLOAD = {"client_id": "client-123", "workflow_key": "tiktok_live_helper"}
 
 
-def test_cancel_404_when_workflow_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_cancel_relists_when_cached_id_is_stale(
+    client: httpx.AsyncClient,
+    mock_n8n_deactivate: Callable[..., AsyncMock],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     monkeypatch.setattr(settings, "n8n_api_key", "dummy-key")
+    monkeypatch.setattr(settings, "n8n_api_base_url", "http://n8n:5678/api/v1")
 
-    class _AsyncClientNoMatch:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401 - test helper
-            pass
+    fake = mock_n8n_deactivate()
+    # Workflow re-imported in n8n between the two cancels: id 7 becomes id 8.
+    fake.get.side_effect = [_listing(7), _listing(8)]
+    fake.patch.side_effect = [_status_only(200), _status_only(404), _status_only(200)]
 
-        async def __aenter__(self) -> "_AsyncClientNoMatch":
-            return self
+    first = await client.post("/v1/jobs/job-1/cancel", json=_CANCEL_PAYLOAD)
+    second = await client.post("/v1/jobs/job-2/cancel", json=_CANCEL_PAYLOAD)
 
-        async def __aexit__(self, *exc_info: object) -> None:
-            return None
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert fake.get.await_count == 2
+    assert [call.args[0] for call in fake.patch.await_args_list] == [
+        "http://n8n:5678/api/v1/workflows/7",
+        "http://n8n:5678/api/v1/workflows/7",
+        "http://n8n:5678/api/v1/workflows/8",
+    ]
 
-        async def get(self, url: str, **__: Any) -> httpx.Response:
-            request = httpx.Request("GET", url)
-            return httpx.Response(status_code=200, request=request, json={"data": []})
 
-        async def patch(self, *_: Any, **__: Any) -> httpx.Response:
-            request = httpx.Request("PATCH", "http://test")
-            return httpx.Response(status_code=404, request=request)
+async def test_cancel_relists_after_cache_ttl_expires(
+    client: httpx.AsyncClient,
+    mock_n8n_deactivate: Callable[..., AsyncMock],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "n8n_api_key", "dummy-key")
+    now = [1_000.0]
+    monkeypatch.setattr(n8n_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
 
-    monkeypatch.setattr(httpx, "AsyncClient", _AsyncClientNoMatch)
+    fake = mock_n8n_deactivate([{"id": 7, "name": "tiktok_live_helper", "active": True}])
 
-    payload = {
-        "client_id": "client-456",
-        "workflow_key": "tiktok_live_helper",
-    }
+    await client.post("/v1/jobs/job-1/cancel", json=_CANCEL_PAYLOAD)
+    now[0] += 30.0
+    await client.post("/v1/jobs/job-2/cancel", json=_CANCEL_PAYLOAD)
+    assert fake.get.await_count == 1
 
-    with TestClient(app) as client:
-        response = client.post("/v1/jobs/job-2/cancel", json=payload)
+    now[0] += 31.0
+    response = await client.post("/v1/jobs/job-3/cancel", json=_CANCEL_PAYLOAD)
 
-    assert response.status_code == 404
-    assert response.json()["detail"] == "Workflow not found in n8n"
+    assert response.status_code == 200
+    assert fake.get.await_count == 2
 
 
-def test_cancel_handles_n8n_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_cancel_invalidates_cache_after_n8n_error(
+    client: httpx.AsyncClient,
+    mock_n8n_deactivate: Callable[..., AsyncMock],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     monkeypatch.setattr(settings, "n8n_api_key", "dummy-key")
 
-    class _AsyncClientFailure:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401 - test helper
-            pass
+    fake = mock_n8n_deactivate([{"id": 7, "name": "tiktok_live_helper", "active": True}])
+    fake.patch.side_effect = [_status_only(200), _status_only(500), _status_only(200)]
 
-        async def __aenter__(self) -> "_AsyncClientFailure":
-            return self
+    first = await client.post("/v1/jobs/job-1/cancel", json=_CANCEL_PAYLOAD)
+    failed = await client.post("/v1/jobs/job-2/cancel", json=_CANCEL_PAYLOAD)
+    assert fake.get.await_count == 1
 
-        async def __aexit__(self, *exc_info: object) -> None:
-            return None
+    retried = await client.post("/v1/jobs/job-3/cancel", json=_CANCEL_PAYLOAD)
 
-        async def get(self, url: str, **__: Any) -> httpx.Response:
-            request = httpx.Request("GET", url)
-            response = httpx.Response(status_code=500, request=request)
-            response.raise_for_status()
-            return response
+    assert (first.status_code, failed.status_code, retried.status_code) == (200, 502, 200)
+    assert fake.get.await_count == 2
 
-    monkeypatch.setattr(httpx, "AsyncClient", _AsyncClientFailure)
+
+async def test_cancel_requires_api_key(
+    client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "n8n_api_key", None)
 
     payload = {
-        "client_id": "client-555",
+        "client_id": "client-789",
         "workflow_key": "tiktok_live_helper",
     }
 
-    with TestClient(app) as client:
-        response = client.post("/v1/jobs/job-3/cancel", json=payload)
+    response = await client.post("/v1/jobs/job-1/cancel", json=payload)
 
-    assert response.status_code == 502
-    assert response.json()["detail"] == "Failed to deactivate workflow via n8n"
+    assert response.status_code == 503
+    assert "N8N_API_KEY" in response.json()["detail"]
@@ -1,19 +1,15 @@
-from fastapi.testclient import TestClient
+import httpx
 
-from apps.api.main import app
 
-client = TestClient(app)
-
-
-def test_meta_returns_200():
+async def test_meta_returns_200(client: httpx.AsyncClient) -> None:
     """Test that meta endpoint returns 200 status code."""
-    response = client.get("/v1/meta")
+    response = await client.get("/v1/meta")
     assert response.status_code == 200
 
 
-def test_meta_response_structure():
+async def test_meta_response_structure(client: httpx.AsyncClient) -> None:
     """Test that meta endpoint returns correct JSON structure."""
-    response = client.get("/v1/meta")
+    response = await client.get("/v1/meta")
     data = response.json()
 
     assert "service" in data
@@ -22,33 +18,33 @@ def test_meta_response_structure():
     assert "build_sha" in data
 
 
-def test_meta_service_name():
+async def test_meta_service_name(client: httpx.AsyncClient) -> None:
     """Test that meta endpoint returns service name."""
-    response = client.get("/v1/meta")
+    response = await client.get("/v1/meta")
     data = response.json()
 
     assert data["service"] == "flowbiz-template-service"
 
 
-def test_meta_environment():
+async def test_meta_environment(client: httpx.AsyncClient) -> None:
     """Test that meta endpoint returns environment."""
-    response = client.get("/v1/meta")
+    response = await client.get("/v1/meta")
     data = response.json()
 
     assert data["environment"] in ["dev", "prod"]
 
 
-def test_meta_version():
+async def test_meta_version(client: httpx.AsyncClient) -> None:
     """Test that meta endpoint returns version."""
-    response = client.get("/v1/meta")
+    response = await client.get("/v1/meta")
     data = response.json()
 
     assert data["version"] == "0.1.0"
 
 
-def test_meta_build_sha():
+async def test_meta_build_sha(client: httpx.AsyncClient) -> None:
     """Test that meta endpoint returns build_sha."""
-    response = client.get("/v1/meta")
+    response = await client.get("/v1/meta")
     data = response.json()
 
     assert "build_sha" in data
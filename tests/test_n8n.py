@@ -0,0 +1,24 @@
+import pytest
+
+from packages.core.n8n import build_workflow_index, lookup_workflow_id
+
+
+@pytest.mark.parametrize(
+    ("workflows", "workflow_key", "expected"),
+    [
+        # Slug match on an earlier workflow beats an exact name match later on.
+        ([{"id": 1, "name": "Foo Bar"}, {"id": 2, "name": "foo_bar"}], "foo_bar", "1"),
+        ([{"id": 2, "name": "foo_bar"}, {"id": 1, "name": "Foo Bar"}], "foo_bar", "2"),
+        # A name equal to another workflow's id resolves to whichever comes first.
+        ([{"id": 5, "name": "alpha"}, {"id": 7, "name": "5"}], "5", "5"),
+        ([{"id": 7, "name": "5"}, {"id": 5, "name": "alpha"}], "5", "7"),
+        ([{"id": "ABC", "name": "alpha"}], "abc", "ABC"),
+        ([{"id": 1, "name": "alpha"}], "missing", None),
+    ],
+)
+def test_lookup_returns_first_matching_workflow_in_list_order(
+    workflows: list[dict[str, object]], workflow_key: str, expected: str | None
+) -> None:
+    index = build_workflow_index(workflows)
+
+    assert lookup_workflow_id(index, workflow_key) == expected
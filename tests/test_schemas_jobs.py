@@ -1,20 +1,16 @@
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
 from packages.core.schemas.callback import AuditEntry, CallbackStatus, JobCallback
-from packages.core.schemas.job import JobRequest, JobResponse, JobStatus
+from packages.core.schemas.job import JobRequestAdapter, JobResponse, JobStatus
 
 
-def test_job_request_defaults() -> None:
-    req = JobRequest(
-        job_id="job-123",
-        client_id="client-abc",
-        workflow_key="wf-key",
-        inputs={"foo": "bar"},
-        callback_url="https://example.com/callback",
-    )
+def test_job_request_defaults(base_job: Mapping[str, Any]) -> None:
+    req = JobRequestAdapter.validate_python(base_job)
 
     assert req.priority == 5
     assert req.timeout_seconds == 300
@@ -30,45 +26,27 @@ def test_job_request_defaults() -> None:
         (10, True),
     ],
 )
-def test_job_request_priority_bounds(priority: int, is_valid: bool) -> None:
-    payload = {
-        "job_id": "job-123",
-        "client_id": "client-abc",
-        "workflow_key": "wf-key",
-        "inputs": {},
-        "callback_url": "https://example.com/callback",
-        "priority": priority,
-    }
+def test_job_request_priority_bounds(
+    base_job: Mapping[str, Any], priority: int, is_valid: bool
+) -> None:
+    payload = {**base_job, "priority": priority}
 
     if is_valid:
-        req = JobRequest(**payload)
+        req = JobRequestAdapter.validate_python(payload)
         assert req.priority == priority
     else:
         with pytest.raises(ValidationError):
-            JobRequest(**payload)
+            JobRequestAdapter.validate_python(payload)
 
 
-def test_job_request_timeout_seconds_invalid() -> None:
+def test_job_request_timeout_seconds_invalid(base_job: Mapping[str, Any]) -> None:
     with pytest.raises(ValidationError):
-        JobRequest(
-            job_id="job-123",
-            client_id="client-abc",
-            workflow_key="wf-key",
-            inputs={},
-            callback_url="https://example.com/callback",
-            timeout_seconds=0,
-        )
+        JobRequestAdapter.validate_python({**base_job, "timeout_seconds": 0})
 
 
-def test_job_request_id_fields_require_value() -> None:
+def test_job_request_id_fields_require_value(base_job: Mapping[str, Any]) -> None:
     with pytest.raises(ValidationError):
-        JobRequest(
-            job_id="",
-            client_id="client-abc",
-            workflow_key="wf-key",
-            inputs={},
-            callback_url="https://example.com/callback",
-        )
+        JobRequestAdapter.validate_python({**base_job, "job_id": ""})
 
 
 def test_job_response_status_enum() -> None: